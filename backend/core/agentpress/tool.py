@@ -38,9 +38,12 @@ class ToolResult:
     Attributes:
         success (bool): Whether the tool execution succeeded
         output (str): Output message or error description
+        data (Optional[Dict[str, Any]]): Structured result details for callers;
+            excluded from repr so it never leaks into str(result)
     """
     success: bool
     output: str
+    data: Optional[Dict[str, Any]] = field(default=None, repr=False)
 
 @dataclass
 class ToolMetadata:
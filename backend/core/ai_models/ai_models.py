@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Dict, Any, Union
 from enum import Enum
 
@@ -109,8 +110,45 @@ class Model:
     def is_free_tier(self) -> bool:
         return "free" in self.tier_availability
     
-    def get_litellm_params(self, **override_params) -> Dict[str, Any]:
-        """Get complete LiteLLM parameters for this model, including all configuration."""
+    @property
+    def is_free(self) -> bool:
+        return (
+            self.pricing is not None
+            and self.pricing.input_cost_per_million_tokens == 0
+            and self.pricing.output_cost_per_million_tokens == 0
+        )
+    
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Model info in the shape the models API serves, built once per model.
+        
+        'enabled' is a snapshot taken on first access; callers overlay the
+        current flag since enable_model/disable_model can change it.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "provider": self.provider.value,
+            "context_window": self.context_window,
+            "max_output_tokens": self.max_output_tokens,
+            "capabilities": [cap.value for cap in self.capabilities],
+            "capabilities_str": ", ".join(cap.value for cap in self.capabilities),
+            "pricing": {
+                "input_per_million": self.pricing.input_cost_per_million_tokens,
+                "output_per_million": self.pricing.output_cost_per_million_tokens,
+            } if self.pricing else None,
+            "is_free": self.is_free,
+            "enabled": self.enabled,
+            "beta": self.beta,
+            "tier_availability": self.tier_availability,
+            "tier_availability_str": ", ".join(self.tier_availability),
+            "priority": self.priority,
+            "recommended": self.recommended,
+        }
+    
+    @cached_property
+    def _base_litellm_params(self) -> Dict[str, Any]:
+        """LiteLLM parameters derived from the model's own configuration, built once."""
         # Start with intelligent defaults
         params = {
             "model": self.id,
@@ -139,6 +177,15 @@ class Model:
             if self.config.performanceConfig:
                 params["performanceConfig"] = self.config.performanceConfig.copy()
         
+        return params
+    
+    def get_litellm_params(self, **override_params) -> Dict[str, Any]:
+        """Get complete LiteLLM parameters for this model, including all configuration."""
+        params = dict(self._base_litellm_params)
+        # Overrides merge into these in place; keep the cached copies pristine
+        for key in ("headers", "extra_headers", "performanceConfig"):
+            if key in params:
+                params[key] = params[key].copy()
         
         # Apply any runtime overrides
         for key, value in override_params.items():
@@ -153,23 +153,12 @@ class ModelManager:
         if not model:
             return {"error": f"Model '{model_id}' not found"}
         
-        return {
-            "id": model.id,
-            "name": model.name,
-            "provider": model.provider.value,
-            "context_window": model.context_window,
-            "max_output_tokens": model.max_output_tokens,
-            "capabilities": [cap.value for cap in model.capabilities],
-            "pricing": {
-                "input_per_million": model.pricing.input_cost_per_million_tokens,
-                "output_per_million": model.pricing.output_cost_per_million_tokens,
-            } if model.pricing else None,
-            "enabled": model.enabled,
-            "beta": model.beta,
-            "tier_availability": model.tier_availability,
-            "priority": model.priority,
-            "recommended": model.recommended,
-        }
+        return self._model_info(model)
+    
+    @staticmethod
+    def _model_info(model: Model) -> Dict[str, Any]:
+        # Fresh top-level dict over the cached snapshot, with the live enabled flag
+        return {**model.as_dict, "enabled": model.enabled}
     
     def list_available_models(
         self,
@@ -196,7 +185,7 @@ class ModelManager:
             key=lambda m: (not m.is_free_tier, -m.priority, m.name)
         )
         
-        return [self.format_model_info(m.id) for m in models]
+        return [self._model_info(m) for m in models]
     
     def get_legacy_constants(self) -> Dict:
         return self.registry.to_legacy_format()
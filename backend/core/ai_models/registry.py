@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import Dict, List, Optional, Set
 from .ai_models import Model, ModelProvider, ModelCapability, ModelPricing, ModelConfig
 from core.utils.config import config, EnvMode
@@ -39,8 +40,16 @@ class ModelRegistry:
     def __init__(self):
         self._models: Dict[str, Model] = {}
         self._aliases: Dict[str, str] = {}
+        self._by_provider: Dict[ModelProvider, List[Model]] = defaultdict(list)
+        self._by_tier: Dict[str, List[Model]] = defaultdict(list)
+        self._version = 0
         self._initialize_models()
     
+    @property
+    def version(self) -> int:
+        """Bumped whenever a model is registered, enabled or disabled."""
+        return self._version
+    
     def _initialize_models(self):
         self.register(Model(
             id="anthropic/claude-haiku-4-5" if SHOULD_USE_ANTHROPIC else "bedrock/converse/arn:aws:bedrock:us-west-2:935064898258:application-inference-profile/heol2zyy5v48",
@@ -628,11 +637,37 @@ class ModelRegistry:
         
     
     def register(self, model: Model) -> None:
+        self._index(model, self._models.get(model.id))
         self._models[model.id] = model
         # Register both exact ID and lowercase version for case-insensitive lookup
         self._aliases[model.id.lower()] = model.id
         for alias in model.aliases:
             self._aliases[alias.lower()] = model.id
+        self._version += 1
+    
+    def _index(self, model: Model, previous: Optional[Model]) -> None:
+        """Add model to the lookup indexes, replacing any model registered under the same ID."""
+        self._reindex(
+            self._by_provider, previous, model,
+            [previous.provider] if previous else [], [model.provider]
+        )
+        self._reindex(
+            self._by_tier, previous, model,
+            previous.tier_availability if previous else [], model.tier_availability
+        )
+    
+    @staticmethod
+    def _reindex(index: Dict, previous: Optional[Model], model: Model, old_keys: List, new_keys: List) -> None:
+        for key in old_keys:
+            if key not in new_keys:
+                index[key].remove(previous)
+        for key in new_keys:
+            models = index[key]
+            if key in old_keys:
+                # Keep the replaced model's position so listing order stays stable
+                models[models.index(previous)] = model
+            else:
+                models.append(model)
     
     def _register_ollama_models(self) -> None:
         """Auto-discover and register models from Ollama server."""
@@ -753,20 +788,28 @@ class ModelRegistry:
         return models
     
     def get_by_tier(self, tier: str, enabled_only: bool = True) -> List[Model]:
-        models = self.get_all(enabled_only)
-        return [m for m in models if tier in m.tier_availability]
+        models = self._by_tier.get(tier, [])
+        if enabled_only:
+            return [m for m in models if m.enabled]
+        return list(models)
     
     def get_by_provider(self, provider: ModelProvider, enabled_only: bool = True) -> List[Model]:
-        models = self.get_all(enabled_only)
-        return [m for m in models if m.provider == provider]
+        models = self._by_provider.get(provider, [])
+        if enabled_only:
+            return [m for m in models if m.enabled]
+        return list(models)
     
     def get_by_capability(self, capability: ModelCapability, enabled_only: bool = True) -> List[Model]:
         models = self.get_all(enabled_only)
         return [m for m in models if capability in m.capabilities]
     
     def resolve_model_id(self, model_id: str) -> Optional[str]:
-        model = self.get(model_id)
-        return model.id if model else None
+        if not model_id:
+            return None
+        if model_id in self._models:
+            return model_id
+        # _aliases holds every lowercased ID and alias, so this is a single lookup
+        return self._aliases.get(model_id.lower())
     
     
     def get_aliases(self, model_id: str) -> List[str]:
@@ -777,6 +820,7 @@ class ModelRegistry:
         model = self.get(model_id)
         if model:
             model.enabled = True
+            self._version += 1
             return True
         return False
     
@@ -784,6 +828,7 @@ class ModelRegistry:
         model = self.get(model_id)
         if model:
             model.enabled = False
+            self._version += 1
             return True
         return False
     
@@ -309,6 +309,7 @@ class SubscriptionService:
             await self.handle_subscription_change(updated_subscription)
 
             await Cache.invalidate(f"subscription_tier:{account_id}")
+            await Cache.invalidate(f"model_tier:{account_id}")
             await Cache.invalidate(f"credit_balance:{account_id}")
             await Cache.invalidate(f"credit_summary:{account_id}")
             
@@ -389,6 +390,7 @@ class SubscriptionService:
             await self.handle_subscription_change(subscription)
             
             await Cache.invalidate(f"subscription_tier:{account_id}")
+            await Cache.invalidate(f"model_tier:{account_id}")
             await Cache.invalidate(f"credit_balance:{account_id}")
             await Cache.invalidate(f"credit_summary:{account_id}")
             
@@ -194,11 +194,8 @@ async def list_models_by_provider(
         db = DBConnection()
         client = await db.client
         
-        # Get available models for user
-        models = await model_selector.get_available_models(client, user_id, include_disabled=False)
-        
-        # Group by provider
-        grouped = model_selector.group_models_by_provider(models)
+        # Get available models for user, grouped by provider
+        grouped = await model_selector.get_available_models_by_provider(client, user_id, include_disabled=False)
         
         # Get default model
         default_model = await model_selector.get_default_model(client, user_id)
@@ -0,0 +1,185 @@
+"""
+HTML parsing for LocalWebSearchTool.
+
+Runs in the tool's parse process pool, so it deliberately imports nothing
+beyond lxml and Readability: every pool worker imports this module to
+unpickle parse_html, and pulling in the backend there would load config,
+the model registry and LiteLLM in each worker.
+"""
+
+import re
+from typing import Any, Dict, List, Union
+
+# Stop collecting links once this many have been found
+_MAX_LINKS = 50
+
+# Pages outside this size range skip Readability (see parse_html)
+_READABILITY_MIN_CHARS = 5_000
+_READABILITY_MAX_CHARS = 1_000_000
+
+_HEADING_LEVELS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+_BLOCK_TAGS = {'p', 'div', 'section', 'article', 'main', 'header', 'footer', 'figure', 'table', 'tr', 'dl', 'dd', 'dt'}
+_SKIP_TAGS = {'script', 'style', 'img', 'noscript', 'svg'}
+# Tags emitted on their own lines; whitespace-only text around them is source formatting
+_LINE_TAGS = _BLOCK_TAGS | set(_HEADING_LEVELS) | {'ul', 'ol', 'li', 'pre', 'blockquote', 'br'}
+_WHITESPACE_RE = re.compile(r'\s+')
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+_TRAILING_SPACES_RE = re.compile(r'[ \t]+\n')
+
+
+def _tree_to_markdown(tree, include_links: bool) -> str:
+    """Emit markdown for the tags Readability keeps, walking an existing lxml tree."""
+    parts: List[str] = []
+    _emit_markdown(tree, parts, include_links)
+    markdown = _TRAILING_SPACES_RE.sub('\n', ''.join(parts))
+    markdown = _EXTRA_NEWLINES_RE.sub('\n\n', markdown).strip()
+    return f"{markdown}\n" if markdown else ""
+
+
+def _emit_markdown(element, parts: List[str], include_links: bool, list_marker: str = "- ", indent: str = "") -> None:
+    # indent is the prefix for list items at this depth: each enclosing item
+    # adds its marker's width, so nested lists line up under the parent's text
+    tag = element.tag if isinstance(element.tag, str) else None
+    
+    if tag is not None and tag not in _SKIP_TAGS:
+        if tag == 'pre':
+            parts.append(f"\n\n```\n{element.text_content().strip()}\n```\n\n")
+        elif tag == 'code':
+            parts.append(f"`{element.text_content()}`")
+        elif tag == 'br':
+            parts.append("\n")
+        elif tag == 'blockquote':
+            quoted: List[str] = []
+            _emit_children(element, quoted, include_links)
+            lines = _EXTRA_NEWLINES_RE.sub('\n\n', ''.join(quoted)).strip().split('\n')
+            parts.append("\n\n" + "\n".join(f"> {line}".rstrip() for line in lines) + "\n\n")
+        elif tag in ('ul', 'ol'):
+            # Only a top-level list is set off by blank lines; nested ones stay tight
+            gap = "" if indent else "\n"
+            parts.append(gap)
+            items = (child for child in element if child.tag == 'li')
+            for idx, item in enumerate(items, 1):
+                _emit_markdown(item, parts, include_links, f"{idx}. " if tag == 'ol' else "- ", indent)
+            parts.append(gap)
+        elif tag == 'li':
+            parts.append(f"\n{indent}{list_marker}")
+            _emit_children(element, parts, include_links, indent + " " * len(list_marker))
+        elif tag in _HEADING_LEVELS:
+            parts.append(f"\n\n{'#' * _HEADING_LEVELS[tag]} ")
+            _emit_children(element, parts, include_links, indent)
+            parts.append("\n\n")
+        elif tag == 'a' and include_links and element.get('href'):
+            parts.append("[")
+            _emit_children(element, parts, include_links, indent)
+            parts.append(f"]({element.get('href')})")
+        elif tag in ('strong', 'b'):
+            parts.append("**")
+            _emit_children(element, parts, include_links, indent)
+            parts.append("**")
+        elif tag in ('em', 'i'):
+            parts.append("_")
+            _emit_children(element, parts, include_links, indent)
+            parts.append("_")
+        elif tag in _BLOCK_TAGS:
+            parts.append("\n\n")
+            _emit_children(element, parts, include_links, indent)
+            parts.append("\n\n")
+        else:
+            _emit_children(element, parts, include_links, indent)
+    
+    if element.tail and (element.tail.strip() or tag not in _LINE_TAGS):
+        parts.append(_WHITESPACE_RE.sub(' ', element.tail))
+
+
+def _emit_children(element, parts: List[str], include_links: bool, indent: str = "") -> None:
+    if element.text and (element.text.strip() or element.tag not in _LINE_TAGS):
+        parts.append(_WHITESPACE_RE.sub(' ', element.text))
+    for child in element:
+        _emit_markdown(child, parts, include_links, indent=indent)
+
+
+def _html_tree(html: Union[str, bytes]):
+    import lxml.html
+    import lxml.etree
+    try:
+        try:
+            return lxml.html.fromstring(html)
+        except ValueError:
+            # lxml rejects str input that carries an XML encoding declaration
+            return lxml.html.fromstring(html.encode('utf-8'))
+    except lxml.etree.ParserError:
+        # Markup libxml2 gives up on; let BeautifulSoup build the lxml tree instead
+        from lxml.html import soupparser
+        return soupparser.fromstring(html)
+
+
+def _find_main_content(page_tree):
+    for path in ('.//article', './/main'):
+        element = page_tree.find(path)
+        if element is not None:
+            return element
+    return None
+
+
+def parse_html(html: Union[str, bytes], url: str, extract_markdown: bool, include_links: bool) -> Dict[str, Any]:
+    """Extract title, text, links and markdown from a fetched page."""
+    import lxml.html
+    import lxml.etree
+    from readability import Document
+    
+    # Readability's block scoring is wasted on tiny pages and is the dominant
+    # cost on huge ones; use the page body / <article> / <main> there instead
+    page_tree = None
+    content_tree = None
+    if not _READABILITY_MIN_CHARS <= len(html) <= _READABILITY_MAX_CHARS:
+        page_tree = _html_tree(html)
+        if len(html) < _READABILITY_MIN_CHARS:
+            content_tree = page_tree.find('body')
+            if content_tree is None:
+                content_tree = page_tree
+        else:
+            content_tree = _find_main_content(page_tree)
+    
+    if content_tree is not None:
+        title = (page_tree.findtext('.//title') or '').strip() or '[no-title]'
+        lxml.etree.strip_elements(content_tree, 'script', 'style', 'noscript', with_tail=False)
+    else:
+        # Extract main content using Readability
+        doc = Document(html)
+        title = doc.title()
+        content_tree = _html_tree(doc.summary())
+    
+    # Extract text straight from the libxml2 tree
+    text_content = '\n'.join(
+        text.strip() for text in content_tree.itertext() if text.strip()
+    )
+    
+    # Extract links if requested
+    links = []
+    if include_links:
+        if page_tree is None:
+            page_tree = _html_tree(html)
+        # Resolved in C, honouring any <base href>; malformed hrefs are left as-is
+        # instead of aborting the whole scrape
+        page_tree.resolve_base_href(handle_failures='ignore')
+        page_tree.make_links_absolute(url, resolve_base_href=False, handle_failures='ignore')
+        for element, attribute, link_href, _ in page_tree.iterlinks():
+            if element.tag != 'a' or attribute != 'href':
+                continue
+            link_text = element.text_content().strip()
+            if link_text and link_href:
+                links.append({'text': link_text, 'url': link_href})
+                if len(links) >= _MAX_LINKS:
+                    break
+    
+    # Convert to markdown if requested, reusing the already-parsed tree
+    markdown_content = ""
+    if extract_markdown:
+        markdown_content = _tree_to_markdown(content_tree, include_links)
+    
+    return {
+        "title": title,
+        "text_content": text_content,
+        "links": links,
+        "markdown_content": markdown_content,
+    }
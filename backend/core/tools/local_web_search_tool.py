@@ -3,7 +3,7 @@ Local Web Search Tool - FREE alternative to Tavily + Firecrawl
 
 Uses free services for web search and scraping:
 - DuckDuckGo for search (no API key required)
-- BeautifulSoup + requests for web scraping (no API key required)
+- lxml + aiohttp for web scraping (no API key required)
 - Readability for content extraction
 
 NOTE: Runs directly on the backend (not in sandbox) to ensure internet connectivity.
@@ -11,17 +11,214 @@ NOTE: Runs directly on the backend (not in sandbox) to ensure internet connectiv
 
 from core.agentpress.tool import Tool, ToolResult, openapi_schema, tool_metadata, method_metadata
 from core.agentpress.thread_manager import ThreadManager
+from core.tools.html_parsing import parse_html
 from core.utils.logger import logger
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse, urljoin
+from typing import List, Dict, Any, Optional, Tuple, Union, Hashable, Callable
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 import ipaddress
 import socket
-import json
+import os
+import random
+import time
+import copy
+import hashlib
+import multiprocessing
+import threading
 import asyncio
+import aiohttp
+
+_SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    # aiohttp decompresses transparently; br needs the Brotli package
+    'Accept-Encoding': 'gzip, deflate, br',
+}
+
+# Budget for getting response headers on the first attempt. A slow DNS lookup or
+# half-open connection gets one jittered retry instead of stalling a whole batch.
+_FAST_ATTEMPT_TIMEOUT = 3
+
+# Page output is capped at 50K chars anyway; don't download more than this
+_MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+_HTML_CONTENT_TYPES = ('text/html', 'application/xhtml')
+
+# Minimum spacing between scrapes of the same host within one search_and_scrape_free call
+_SAME_HOST_DELAY = 1.0
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+_http_session: Optional[aiohttp.ClientSession] = None
+_http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+# One DDGS client per search worker thread, so its keep-alive connections to
+# duckduckgo.com are reused across queries without sharing a client between threads
+_ddgs_clients = threading.local()
+
+# Field names used for the same value by the different DuckDuckGo backends
+_TITLE_KEYS = ("title", "t")
+_URL_KEYS = ("href", "link", "u")
+_SNIPPET_KEYS = ("body", "a", "description")
+
+
+def _first_value(result: Dict[str, Any], keys: tuple, default: str) -> str:
+    """Return the first truthy value among keys, or default."""
+    return next((result[key] for key in keys if result.get(key)), default)
+
+
+class _TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after a fixed TTL.
+    
+    Bounded by entry count and, when weigh is given, by the total weight of
+    the stored values (e.g. bytes of output).
+    """
+    
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        max_weight: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self._weight = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        self._pop(key)
+        weight = self.weigh(value) if self.weigh else 0
+        self._entries[key] = (time.monotonic() + self.ttl, value, weight)
+        self._weight += weight
+        while self._entries and (
+            len(self._entries) > self.maxsize
+            or (self.max_weight is not None and self._weight > self.max_weight)
+        ):
+            self._pop(next(iter(self._entries)))
+    
+    def _pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._weight -= entry[2]
+
+
+def _result_size(value: Any) -> int:
+    result = value[1] if isinstance(value, tuple) else value
+    return len(result.output)
+
+
+# Keyed by (query, region, max_results) and _scrape_cache_key()
+_search_cache = _TTLCache(maxsize=512, ttl=300)
+_scrape_cache = _TTLCache(maxsize=256, ttl=3600, max_weight=50 * 1024 * 1024, weigh=_result_size)
+# ETag / Last-Modified plus the last result, for revalidating expired scrapes
+_scrape_validators = _TTLCache(maxsize=256, ttl=24 * 3600, max_weight=50 * 1024 * 1024, weigh=_result_size)
+
+# Query parameters that only track the visitor and never change page content
+_TRACKING_PARAMS = ('fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+
+def _scrape_cache_key(url: str, extract_markdown: bool, include_links: bool) -> str:
+    parts = urlsplit(_canonical_url(url))
+    query = urlencode([
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith('utm_') and name.lower() not in _TRACKING_PARAMS
+    ])
+    normalized = urlunsplit(parts._replace(query=query))
+    return hashlib.blake2b(
+        f"{normalized}|{extract_markdown}|{include_links}".encode(), digest_size=16
+    ).hexdigest()
+
+
+def _cached_scrape_result(result: ToolResult) -> ToolResult:
+    """Copy a cached scrape result, flagging it as a cache hit."""
+    hit = copy.copy(result)
+    hit.data = {**result.data, "cache_hit": True}
+    return hit
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the process pool used for HTML parsing, creating it on first use."""
+    global _parse_pool
+    if _parse_pool is None:
+        # Never fork: the worker is multithreaded, and a forked child can inherit
+        # a lock some other thread was holding and deadlock on it
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(start_method),
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool(wait: bool = True) -> None:
+    """Shut down the HTML parsing pool, if one was started; the next parse starts a new one."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=wait, cancel_futures=True)
+    _parse_pool = None
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize scheme/host case, empty paths and fragments so equivalent URLs compare equal."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, ''))
+
+
+def _get_http_session(timeout: int) -> aiohttp.ClientSession:
+    """Return the shared scraping session, creating it for the running loop if needed."""
+    global _http_session, _http_session_loop
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _http_session_loop is not loop:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=timeout, connect=10),
+            headers=_SCRAPE_HEADERS,
+        )
+        _http_session_loop = loop
+    return _http_session
+
+
+def _get_ddgs():
+    """Return this thread's DuckDuckGo client, creating it on first use."""
+    from duckduckgo_search import DDGS
+    ddgs = getattr(_ddgs_clients, 'client', None)
+    if ddgs is None:
+        ddgs = _ddgs_clients.client = DDGS()
+    return ddgs
+
+
+async def close_http_session() -> None:
+    """Close the shared scraping session, if one is open."""
+    global _http_session, _http_session_loop
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+    _http_session_loop = None
+
 
 @tool_metadata(
     display_name="Web Search (Local)",
-    description="Free web search and scraping using DuckDuckGo and BeautifulSoup - no API keys required",
+    description="Free web search and scraping using DuckDuckGo and lxml - no API keys required",
     icon="Search",
     color="bg-emerald-100 dark:bg-emerald-800/50",
     weight=55,
@@ -34,7 +231,7 @@ class LocalWebSearchTool(Tool):
     
     Features:
     - Web search using DuckDuckGo (no API key)
-    - Web scraping using BeautifulSoup (no API key)
+    - Web scraping using lxml (no API key)
     - Content extraction using Readability
     - Runs directly on backend for reliable internet access
     """
@@ -45,6 +242,8 @@ class LocalWebSearchTool(Tool):
         self.thread_manager = thread_manager
         self.max_results = 10
         self.timeout = 30
+        # Scrapes currently in flight, so concurrent requests for one page share a fetch
+        self._inflight_scrapes: Dict[str, asyncio.Task] = {}
     
     def _is_safe_public_url(self, url: str) -> tuple[bool, str]:
         """
@@ -101,6 +300,155 @@ class LocalWebSearchTool(Tool):
         except Exception as e:
             return False, f"URL validation error: {str(e)}"
 
+    async def _fetch_html(self, url: str, validators: Optional[Dict[str, str]] = None) -> tuple[Optional[Union[str, bytes]], Dict[str, str]]:
+        """
+        Fetch a page through the shared connection pool.
+        
+        The first attempt must return headers within _FAST_ATTEMPT_TIMEOUT; on a
+        timeout or connection error it is retried once, after a short jitter,
+        with only the session's full timeout applied.
+        
+        Args:
+            url: URL to fetch
+            validators: ETag / Last-Modified values from an earlier fetch, sent
+                as If-None-Match / If-Modified-Since
+        
+        Returns:
+            (html, validators) tuple; html is the decoded body when the server
+            declared a charset, the raw bytes otherwise, and None when the
+            server answered 304 Not Modified
+        """
+        headers = {}
+        if validators:
+            if validators.get('ETag'):
+                headers['If-None-Match'] = validators['ETag']
+            if validators.get('Last-Modified'):
+                headers['If-Modified-Since'] = validators['Last-Modified']
+        
+        session = _get_http_session(self.timeout)
+        try:
+            async with asyncio.timeout(_FAST_ATTEMPT_TIMEOUT):
+                response = await session.get(url, headers=headers, allow_redirects=False)
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+            logger.debug(f"Fast fetch attempt failed for {url}: {e!r}, retrying")
+            await asyncio.sleep(random.uniform(0.1, 0.5))
+            response = await session.get(url, headers=headers, allow_redirects=False)
+        
+        async with response:
+            if response.status == 304 and validators:
+                return None, validators
+            response.raise_for_status()
+            
+            new_validators = {
+                name: response.headers[name]
+                for name in ('ETag', 'Last-Modified')
+                if name in response.headers
+            }
+            
+            content_type = response.headers.get('Content-Type', '').lower()
+            if content_type and not content_type.startswith(_HTML_CONTENT_TYPES):
+                raise ValueError(f"Unsupported content type: {content_type}")
+            
+            # Stop reading at the byte cap rather than buffering arbitrarily large bodies
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(65536):
+                body.extend(chunk)
+                if len(body) >= _MAX_RESPONSE_BYTES:
+                    logger.debug(f"Truncating {url} at {_MAX_RESPONSE_BYTES} bytes")
+                    break
+            # Without a usable declared charset, hand libxml2 the raw bytes so it
+            # can sniff <meta charset> itself instead of guessing UTF-8 here
+            if response.charset:
+                try:
+                    return body.decode(response.charset, errors='replace'), new_validators
+                except LookupError:
+                    logger.debug(f"Unknown charset {response.charset!r} declared by {url}, sniffing instead")
+            return bytes(body), new_validators
+
+    async def _search_results(self, query: str, max_results: int, region: str) -> tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Run a DuckDuckGo search and normalize the results.
+        
+        Shared by web_search and search_and_scrape_free so the combined tool
+        doesn't build (and discard) the formatted search text.
+        
+        Returns:
+            (formatted_results, error_message) tuple
+        """
+        cache_key = (query, region, max_results)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Returning cached DuckDuckGo results for: '{query}'")
+            return cached, None
+        
+        logger.info(f"Searching DuckDuckGo for: '{query}' (max_results={max_results}, region={region})")
+        
+        # Import here to provide better error messages
+        try:
+            import duckduckgo_search  # noqa: F401
+        except ImportError:
+            return [], "DuckDuckGo search library not installed. Install with: pip install duckduckgo-search"
+        
+        # Race all backends concurrently and take the first non-empty result
+        # (run in threads to avoid blocking event loop)
+        results = []
+        last_error = None
+
+        def _do_search(backend: str) -> List[Dict[str, Any]]:
+            return list(_get_ddgs().text(
+                query,
+                region=region,
+                max_results=max_results,
+                safesearch="moderate",
+                backend=backend
+            ))
+
+        tasks = {
+            asyncio.create_task(asyncio.to_thread(_do_search, backend)): backend
+            for backend in ("api", "lite", "html")
+        }
+        try:
+            while tasks and not results:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    backend = tasks.pop(task)
+                    try:
+                        backend_results = task.result()
+                    except Exception as backend_err:
+                        last_error = str(backend_err)
+                        logger.debug(f"Backend {backend} failed: {backend_err}")
+                        continue
+                    if backend_results and not results:
+                        results = backend_results
+                        logger.info(f"Successfully got {len(results)} results using backend: {backend}")
+        finally:
+            # Threads can't be interrupted, but nobody waits on the losers
+            for task in tasks:
+                task.cancel()
+
+        # Check if we got any results
+        if not results:
+            error_msg = f"No results found for '{query}'. "
+            if last_error:
+                error_msg += f"Last error: {last_error}"
+            logger.warning(error_msg)
+            return [], error_msg
+        
+        # Format results - handle multiple result formats from different backends
+        formatted_results = [
+            {
+                "title": _first_value(result, _TITLE_KEYS, "No title"),
+                "url": _first_value(result, _URL_KEYS, ""),
+                "snippet": _first_value(result, _SNIPPET_KEYS, ""),
+                "position": idx
+            }
+            for idx, result in enumerate(results, 1)
+        ]
+        
+        logger.info(f"Search completed: {len(formatted_results)} results found")
+        _search_cache.set(cache_key, formatted_results)
+        return formatted_results, None
+
     @method_metadata(
         display_name="Search Web",
         description="Search the web using DuckDuckGo - completely free, no API key required",
@@ -149,68 +497,16 @@ class LocalWebSearchTool(Tool):
         try:
             max_results = min(max_results, 10)  # Cap at 10
             
-            logger.info(f"Searching DuckDuckGo for: '{query}' (max_results={max_results}, region={region})")
-            
-            # Import here to provide better error messages
-            try:
-                from duckduckgo_search import DDGS
-            except ImportError:
-                return self.fail_response("DuckDuckGo search library not installed. Install with: pip install duckduckgo-search")
-            
-            # Try multiple backends for reliability (run in thread to avoid blocking event loop)
-            results = []
-            last_error = None
-            
-            for backend in ("api", "lite", "html"):
-                try:
-                    logger.debug(f"Trying DuckDuckGo backend: {backend}")
-                    
-                    # Run blocking search in thread pool
-                    def _do_search():
-                        with DDGS() as ddgs:
-                            return list(ddgs.text(
-                                query, 
-                                region=region, 
-                                max_results=max_results,
-                                safesearch="moderate",
-                                backend=backend
-                            ))
-                    
-                    results = await asyncio.to_thread(_do_search)
-                    
-                    if results:
-                        logger.info(f"Successfully got {len(results)} results using backend: {backend}")
-                        break
-                except Exception as backend_err:
-                    last_error = str(backend_err)
-                    logger.debug(f"Backend {backend} failed: {backend_err}")
-                    continue
-            
-            # Check if we got any results
-            if not results:
-                error_msg = f"No results found for '{query}'. "
-                if last_error:
-                    error_msg += f"Last error: {last_error}"
-                logger.warning(error_msg)
+            formatted_results, error_msg = await self._search_results(query, max_results, region)
+            if error_msg:
                 return self.fail_response(error_msg)
             
-            # Format results - handle multiple result formats from different backends
-            formatted_results = []
-            for idx, result in enumerate(results, 1):
-                formatted_results.append({
-                    "title": result.get("title") or result.get("t") or "No title",
-                    "url": result.get("href") or result.get("link") or result.get("u") or "",
-                    "snippet": result.get("body") or result.get("a") or result.get("description") or "",
-                    "position": idx
-                })
-            
-            result_text = f"Found {len(formatted_results)} results for '{query}':\n\n"
+            parts = [f"Found {len(formatted_results)} results for '{query}':\n\n"]
             for r in formatted_results:
-                result_text += f"{r['position']}. **{r['title']}**\n"
-                result_text += f"   URL: {r['url']}\n"
-                result_text += f"   {r['snippet'][:200]}...\n\n"
-            
-            logger.info(f"Search completed: {len(formatted_results)} results found")
+                parts.append(f"{r['position']}. **{r['title']}**\n")
+                parts.append(f"   URL: {r['url']}\n")
+                parts.append(f"   {r['snippet'][:200]}...\n\n")
+            result_text = "".join(parts)
             
             return ToolResult(
                 output=result_text,
@@ -238,7 +534,7 @@ class LocalWebSearchTool(Tool):
         "type": "function",
         "function": {
             "name": "scrape_webpage",
-            "description": "Scrape content from a URL and extract clean, readable text. Uses BeautifulSoup and Readability for content extraction. Completely free with no API key required.",
+            "description": "Scrape content from a URL and extract clean, readable text. Uses lxml and Readability for content extraction. Completely free with no API key required.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -273,98 +569,101 @@ class LocalWebSearchTool(Tool):
         Returns:
             ToolResult with scraped content
         """
+        cache_key = _scrape_cache_key(url, extract_markdown, include_links)
+        task = self._inflight_scrapes.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._scrape(url, extract_markdown, include_links, cache_key))
+            self._inflight_scrapes[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight_scrapes.pop(cache_key, None))
+        else:
+            logger.info(f"Joining in-flight scrape for: {url}")
+        # Shielded so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _scrape(self, url: str, extract_markdown: bool, include_links: bool, cache_key: str) -> ToolResult:
         try:
             logger.info(f"Scraping URL: {url}")
             
-            # Validate URL for SSRF protection
-            is_safe, error_msg = self._is_safe_public_url(url)
+            cached = _scrape_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Returning cached scrape for: {url}")
+                return _cached_scrape_result(cached)
+            
+            # Validate URL for SSRF protection; its DNS lookup blocks, so run it
+            # in a thread to keep fanned-out scrapes concurrent
+            is_safe, error_msg = await asyncio.to_thread(self._is_safe_public_url, url)
             if not is_safe:
                 logger.warning(f"SSRF protection blocked URL: {url} - {error_msg}")
                 return self.fail_response(f"URL not allowed: {error_msg}")
             
             # Import libraries
             try:
-                import requests
-                from bs4 import BeautifulSoup
-                from readability import Document
-                import html2text
+                import lxml.html  # noqa: F401
+                from readability import Document  # noqa: F401
             except ImportError as e:
-                return self.fail_response(f"Required library not installed: {e}. Install with: pip install requests beautifulsoup4 lxml readability-lxml html2text")
-            
-            # Fetch the page (async-safe, no redirects for security)
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = await asyncio.to_thread(
-                requests.get, 
-                url, 
-                headers=headers, 
-                timeout=15, 
-                allow_redirects=False
-            )
-            response.raise_for_status()
-            
-            # Extract main content using Readability
-            doc = Document(response.text)
-            title = doc.title()
-            content_html = doc.summary()
-            
-            # Parse with BeautifulSoup for cleaning
-            soup = BeautifulSoup(content_html, 'lxml')
-            
-            # Extract text
-            text_content = soup.get_text(separator='\n', strip=True)
-            
-            # Extract links if requested
-            links = []
-            if include_links:
-                for link in soup.find_all('a', href=True):
-                    link_text = link.get_text(strip=True)
-                    link_href = link['href']
-                    if link_text and link_href:
-                        # Make relative URLs absolute
-                        if link_href.startswith('/'):
-                            link_href = urljoin(url, link_href)
-                        links.append({'text': link_text, 'url': link_href})
-            
-            # Convert to markdown if requested
-            markdown_content = ""
-            if extract_markdown:
-                h = html2text.HTML2Text()
-                h.ignore_links = not include_links
-                h.ignore_images = True
-                markdown_content = h.handle(content_html)
+                return self.fail_response(f"Required library not installed: {e}. Install with: pip install lxml readability-lxml")
+            
+            # Fetch the page (no redirects for security), revalidating an
+            # expired entry with a conditional GET where the server supports it
+            stale = _scrape_validators.get(cache_key)
+            html, validators = await self._fetch_html(url, stale[0] if stale else None)
+            if html is None:
+                logger.info(f"Page not modified, reusing previous scrape for: {url}")
+                _scrape_cache.set(cache_key, stale[1])
+                return _cached_scrape_result(stale[1])
+            
+            # Parse in a worker process - Readability and markdown emission are
+            # CPU-bound and would serialize on the GIL when scrapes run concurrently
+            loop = asyncio.get_running_loop()
+            try:
+                parsed = await loop.run_in_executor(
+                    _get_parse_pool(), parse_html, html, url, extract_markdown, include_links
+                )
+            except BrokenProcessPool:
+                logger.warning("HTML parse pool is broken, recreating it and parsing in a thread")
+                shutdown_parse_pool(wait=False)
+                parsed = await loop.run_in_executor(
+                    None, parse_html, html, url, extract_markdown, include_links
+                )
+            title = parsed["title"]
+            text_content = parsed["text_content"]
+            links = parsed["links"]
+            markdown_content = parsed["markdown_content"]
             
             # Format output
-            content = f"# {title}\n\n"
-            content += f"**URL**: {url}\n\n"
+            parts = [f"# {title}\n\n", f"**URL**: {url}\n\n"]
             
             if extract_markdown and markdown_content:
-                content += "## Content (Markdown)\n\n"
-                content += markdown_content[:50000]  # Limit to 50K chars
+                parts.append("## Content (Markdown)\n\n")
+                parts.append(markdown_content[:50000])  # Limit to 50K chars
             else:
-                content += "## Content (Text)\n\n"
-                content += text_content[:50000]
+                parts.append("## Content (Text)\n\n")
+                parts.append(text_content[:50000])
             
             if include_links and links:
-                content += f"\n\n## Links Found ({len(links)})\n\n"
+                parts.append(f"\n\n## Links Found ({len(links)})\n\n")
                 for link in links[:20]:  # Show first 20
-                    content += f"- [{link['text']}]({link['url']})\n"
+                    parts.append(f"- [{link['text']}]({link['url']})\n")
+            content = "".join(parts)
             
             logger.info(f"Successfully scraped {url}: {len(text_content)} chars")
             
-            return ToolResult(
+            result = ToolResult(
                 output=content,
                 data={
                     "title": title,
                     "url": url,
                     "text_length": len(text_content),
                     "links_found": len(links),
-                    "source": "local_scraper"
+                    "source": "local_scraper",
+                    "cache_hit": False
                 },
                 success=True
             )
+            _scrape_cache.set(cache_key, result)
+            if validators:
+                _scrape_validators.set(cache_key, (validators, result))
+            return result
                 
         except Exception as e:
             error_msg = f"Web scraping error: {str(e)}"
@@ -416,52 +715,72 @@ class LocalWebSearchTool(Tool):
             
             # First, perform search
             logger.info(f"Search and scrape: '{query}' (will scrape top {num_results_to_scrape})")
-            search_result = await self.web_search(query, max_results=num_results_to_scrape)
-            
-            if not search_result.success:
-                return search_result
-            
-            # Extract URLs from search results
-            search_data = search_result.data
-            if not search_data or "results" not in search_data:
-                return self.fail_response("No search results to scrape")
+            search_results, error_msg = await self._search_results(query, num_results_to_scrape, "us-en")
+            if error_msg:
+                return self.fail_response(error_msg)
             
-            urls_to_scrape = [r["url"] for r in search_data["results"][:num_results_to_scrape]]
+            # Canonicalize and drop duplicates so the same page isn't fetched twice
+            urls_to_scrape = list(dict.fromkeys(
+                _canonical_url(r["url"]) for r in search_results[:num_results_to_scrape]
+            ))
+            
+            # Scrape each URL. Page bodies only go into the combined output;
+            # the data payload carries metadata so the markdown isn't held
+            # (and serialized) twice.
+            semaphore = asyncio.Semaphore(5)
+            # Distinct hosts start immediately; repeat hits on one host stay spaced out
+            next_allowed: Dict[str, float] = {}
+            
+            async def _scrape(idx: int, url: str) -> ToolResult:
+                host = urlsplit(url).netloc
+                now = time.monotonic()
+                start_at = max(now, next_allowed.get(host, now))
+                next_allowed[host] = start_at + _SAME_HOST_DELAY
+                if start_at > now:
+                    await asyncio.sleep(start_at - now)
+                
+                async with semaphore:
+                    logger.info(f"Scraping {idx}/{len(urls_to_scrape)}: {url}")
+                    return await self.scrape_webpage(url, extract_markdown=True, include_links=False)
+            
+            # Targets are independent (usually distinct hosts), so scrape concurrently
+            scrape_results = await asyncio.gather(
+                *(_scrape(idx, url) for idx, url in enumerate(urls_to_scrape, 1)),
+                return_exceptions=True
+            )
             
-            # Scrape each URL
             scraped_pages = []
-            for idx, url in enumerate(urls_to_scrape, 1):
-                logger.info(f"Scraping {idx}/{len(urls_to_scrape)}: {url}")
-                scrape_result = await self.scrape_webpage(url, extract_markdown=True, include_links=False)
+            page_contents = []
+            for url, scrape_result in zip(urls_to_scrape, scrape_results):
+                if isinstance(scrape_result, BaseException):
+                    scrape_result = self.fail_response(f"Web scraping error: {scrape_result}")
                 
                 if scrape_result.success:
                     scraped_pages.append({
                         "url": url,
                         "title": scrape_result.data.get("title", "No title"),
-                        "content": scrape_result.output,
                         "length": scrape_result.data.get("text_length", 0)
                     })
+                    page_contents.append(scrape_result.output)
                 else:
                     logger.warning(f"Failed to scrape {url}: {scrape_result.output}")
                     scraped_pages.append({
                         "url": url,
                         "title": "Scraping failed",
-                        "content": f"Error: {scrape_result.output}",
                         "length": 0
                     })
-                
-                # Small delay between requests to be respectful
-                if idx < len(urls_to_scrape):
-                    await asyncio.sleep(1)
+                    page_contents.append(f"Error: {scrape_result.output}")
             
             # Format combined output
-            output = f"# Search Results for '{query}'\n\n"
-            output += f"Found and scraped {len(scraped_pages)} pages:\n\n"
-            output += "---\n\n"
-            
-            for page in scraped_pages:
-                output += page['content']
-                output += "\n\n---\n\n"
+            parts = [
+                f"# Search Results for '{query}'\n\n",
+                f"Found and scraped {len(scraped_pages)} pages:\n\n",
+                "---\n\n",
+            ]
+            for page_content in page_contents:
+                parts.append(page_content)
+                parts.append("\n\n---\n\n")
+            output = "".join(parts)
             
             logger.info(f"Search and scrape completed: {len(scraped_pages)} pages processed")
             
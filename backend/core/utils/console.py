@@ -0,0 +1,21 @@
+import codecs
+import sys
+
+
+def ensure_utf8_stdio() -> None:
+    """
+    Make stdout/stderr write UTF-8 on Windows consoles.
+
+    Uses TextIOWrapper.reconfigure where available, which switches the
+    encoding in place; falls back to wrapping the raw buffers with a codecs
+    writer for streams that don't support it.
+    """
+    if sys.platform != 'win32':
+        return
+
+    for name in ('stdout', 'stderr'):
+        stream = getattr(sys, name)
+        try:
+            stream.reconfigure(encoding='utf-8')
+        except AttributeError:
+            setattr(sys, name, codecs.getwriter('utf-8')(stream.buffer, 'strict'))
@@ -5,10 +5,111 @@ Provides functionality for selecting and validating AI models for agents.
 Supports listing available models based on user tier and validating model choices.
 """
 
-from typing import Optional, List, Dict, Any
+from collections import defaultdict
+from typing import Optional, List, Dict, Any, Tuple
 from core.ai_models import model_manager
+from core.utils.cache import Cache
 from core.utils.logger import logger
 
+# Each (tier, include_disabled) listing is formatted once and reused until the
+# registry changes (register, enable_model and disable_model bump its version)
+_models_by_tier: Dict[Tuple[Optional[str], bool], List[Dict[str, Any]]] = {}
+_grouped_by_tier: Dict[Tuple[Optional[str], bool], Dict[str, List[Dict[str, Any]]]] = {}
+_ids_by_tier: Dict[Optional[str], frozenset] = {}
+_registry_version: Optional[int] = None
+
+
+def _sync_with_registry() -> None:
+    """Drop the cached listings if the registry has changed since they were built."""
+    global _registry_version
+    version = model_manager.registry.version
+    if version != _registry_version:
+        _models_by_tier.clear()
+        _grouped_by_tier.clear()
+        _ids_by_tier.clear()
+        _registry_version = version
+
+
+def _cached_listing(tier: Optional[str], include_disabled: bool) -> List[Dict[str, Any]]:
+    _sync_with_registry()
+    key = (tier, include_disabled)
+    models = _models_by_tier.get(key)
+    if models is None:
+        models = model_manager.list_available_models(tier=tier, include_disabled=include_disabled)
+        _models_by_tier[key] = models
+    return models
+
+
+def _list_models(tier: Optional[str], include_disabled: bool) -> List[Dict[str, Any]]:
+    # Callers annotate the dicts (e.g. Ollama status), so hand out copies
+    return [dict(model) for model in _cached_listing(tier, include_disabled)]
+
+
+def _available_model_ids(tier: Optional[str]) -> frozenset:
+    """IDs of the enabled models in a tier, for O(1) availability checks."""
+    _sync_with_registry()
+    model_ids = _ids_by_tier.get(tier)
+    if model_ids is None:
+        model_ids = frozenset(m['id'] for m in _cached_listing(tier, False))
+        _ids_by_tier[tier] = model_ids
+    return model_ids
+
+
+def _group_models(tier: Optional[str], include_disabled: bool) -> Dict[str, List[Dict[str, Any]]]:
+    _sync_with_registry()
+    key = (tier, include_disabled)
+    grouped = _grouped_by_tier.get(key)
+    if grouped is None:
+        grouped = ModelSelector.group_models_by_provider(_cached_listing(tier, include_disabled))
+        _grouped_by_tier[key] = grouped
+    # Fresh lists so callers can reorder or filter without touching the cache
+    return {provider: list(models) for provider, models in grouped.items()}
+
+
+async def _get_user_model_tier(user_id: str) -> str:
+    """Resolve a user's model tier ('free' or 'paid'), cached for 60s."""
+    from core.billing.subscription_service import subscription_service
+    
+    cache_key = f"model_tier:{user_id}"
+    cached = await Cache.get(cache_key)
+    if cached:
+        return cached
+    
+    subscription_info = await subscription_service.get_subscription(user_id)
+    subscription = subscription_info.get('subscription')
+    
+    tier_name = "free"
+    if subscription:
+        tier_info = subscription_info.get('tier', {})
+        if tier_info and tier_info.get('name') != 'free' and tier_info.get('name') != 'none':
+            tier_name = "paid"
+    
+    await Cache.set(cache_key, tier_name, ttl=60)
+    return tier_name
+
+
+async def _user_listing(user_id: str, include_disabled: bool) -> Tuple[Optional[str], bool]:
+    """Pick the (tier, include_disabled) listing a user should see."""
+    try:
+        from core.utils.config import config, EnvMode
+        
+        # In local mode, show all models
+        if config.ENV_MODE == EnvMode.LOCAL:
+            logger.debug(f"Local mode: returning all available models")
+            return None, include_disabled
+        
+        # Get user's subscription tier
+        tier_name = await _get_user_model_tier(user_id)
+        
+        logger.debug(f"User {user_id} tier: {tier_name}")
+        
+        return tier_name, include_disabled
+        
+    except Exception as e:
+        logger.warning(f"Error getting available models for user {user_id}: {e}")
+        # Return free tier models as fallback
+        return "free", False
+
 
 class ModelSelector:
     """Utility class for selecting and managing AI models for agents."""
@@ -26,36 +127,25 @@ class ModelSelector:
         Returns:
             List of model information dictionaries
         """
-        try:
-            from core.billing.subscription_service import subscription_service
-            from core.utils.config import config, EnvMode
-            
-            # In local mode, show all models
-            if config.ENV_MODE == EnvMode.LOCAL:
-                logger.debug(f"Local mode: returning all available models")
-                return model_manager.list_available_models(tier=None, include_disabled=include_disabled)
-            
-            # Get user's subscription tier
-            subscription_info = await subscription_service.get_subscription(user_id)
-            subscription = subscription_info.get('subscription')
-            
-            tier_name = "free"
-            if subscription:
-                tier_info = subscription_info.get('tier', {})
-                if tier_info and tier_info.get('name') != 'free' and tier_info.get('name') != 'none':
-                    tier_name = "paid"
-            
-            logger.debug(f"User {user_id} tier: {tier_name}")
-            
-            # Get models for user's tier
-            models = model_manager.list_available_models(tier=tier_name, include_disabled=include_disabled)
-            
-            return models
+        return _list_models(*await _user_listing(user_id, include_disabled))
+    
+    @staticmethod
+    async def get_available_models_by_provider(client, user_id: str, include_disabled: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get a user's available models grouped by provider.
+        
+        Equivalent to group_models_by_provider(get_available_models(...)), but
+        the grouping is built once per tier rather than on every request.
+        
+        Args:
+            client: Database client
+            user_id: User ID
+            include_disabled: Whether to include disabled models
             
-        except Exception as e:
-            logger.warning(f"Error getting available models for user {user_id}: {e}")
-            # Return free tier models as fallback
-            return model_manager.list_available_models(tier="free", include_disabled=False)
+        Returns:
+            Dictionary mapping provider names to lists of models
+        """
+        return _group_models(*await _user_listing(user_id, include_disabled))
     
     @staticmethod
     async def get_default_model(client, user_id: str) -> str:
@@ -118,15 +208,14 @@ class ModelSelector:
         if config.ENV_MODE == EnvMode.LOCAL:
             return True, ""
         
-        # Get user's available models
+        # Check against the models available on the user's tier
         try:
-            available_models = await ModelSelector.get_available_models(client, user_id, include_disabled=False)
-            available_model_ids = [m['id'] for m in available_models]
+            tier_name, _ = await _user_listing(user_id, include_disabled=False)
             
             # Resolve the model ID in case it's an alias
             resolved_model_id = model_manager.resolve_model_id(model_id)
             
-            if resolved_model_id not in available_model_ids:
+            if resolved_model_id not in _available_model_ids(tier_name):
                 return False, f"Model '{model_id}' is not available for your subscription tier"
             
             return True, ""
@@ -165,6 +254,19 @@ class ModelSelector:
         """
         return model_manager.list_available_models(tier=tier, include_disabled=False)
     
+    @staticmethod
+    def list_all_models_by_provider(tier: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List all available models grouped by provider, optionally filtered by tier.
+        
+        Args:
+            tier: Subscription tier to filter by ('free', 'paid', or None for all)
+            
+        Returns:
+            Dictionary mapping provider names to lists of models
+        """
+        return _group_models(tier, False)
+    
     @staticmethod
     def group_models_by_provider(models: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -176,14 +278,11 @@ class ModelSelector:
         Returns:
             Dictionary mapping provider names to lists of models
         """
-        grouped = {}
+        grouped = defaultdict(list)
         for model in models:
-            provider = model.get('provider', 'unknown')
-            if provider not in grouped:
-                grouped[provider] = []
-            grouped[provider].append(model)
+            grouped[model.get('provider', 'unknown')].append(model)
         
-        return grouped
+        return dict(grouped)
 
 
 # Convenience instance for importing
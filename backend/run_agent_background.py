@@ -9,12 +9,14 @@ from datetime import datetime, timezone
 from typing import Optional
 from core.services import redis
 from core.run import run_agent
+from core.tools.local_web_search_tool import close_http_session, shutdown_parse_pool
 from core.utils.logger import logger, structlog
 import dramatiq
 import uuid
 from core.agentpress.thread_manager import ThreadManager
 from core.services.supabase import DBConnection
 from core.services import redis
+from dramatiq.asyncio import get_event_loop_thread
 from dramatiq.brokers.redis import RedisBroker
 import os
 from core.services.langfuse import langfuse
@@ -29,6 +31,20 @@ redis_port = int(os.getenv('REDIS_PORT', 6379))
 logger.info(f"🔧 Configuring Dramatiq broker with Redis at {redis_host}:{redis_port}")
 redis_broker = RedisBroker(host=redis_host, port=redis_port, middleware=[dramatiq.middleware.AsyncIO()])
 
+
+class ToolCleanupMiddleware(dramatiq.Middleware):
+    """Release resources that tools share across agent runs when the worker stops."""
+
+    def after_worker_shutdown(self, broker, worker):
+        # Runs before AsyncIO's own after_worker_shutdown (hooks fire in reverse),
+        # so the event loop that owns the scraping session is still up
+        event_loop_thread = get_event_loop_thread()
+        if event_loop_thread is not None:
+            event_loop_thread.run_coroutine(close_http_session())
+        shutdown_parse_pool()
+
+
+redis_broker.add_middleware(ToolCleanupMiddleware())
 dramatiq.set_broker(redis_broker)
 
 _initialized = False
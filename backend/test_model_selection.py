@@ -11,78 +11,86 @@ This script demonstrates:
 import sys
 import os
 
-# Fix Windows console encoding
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
-
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
+from core.utils.console import ensure_utf8_stdio
+# Fix Windows console encoding
+ensure_utf8_stdio()
+
 from core.utils.model_selector import model_selector
 from core.ai_models import model_manager
 from core.utils.config import config
 
 
-def print_separator(title):
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+SEPARATOR = "=" * 70
+BANNER = "\n".join([
+    "\n╔" + "═" * 68 + "╗",
+    "║" + " " * 20 + "MODEL SELECTION TEST SUITE" + " " * 22 + "║",
+    "╚" + "═" * 68 + "╝",
+])
+
 
+def separator(title):
+    return f"\n{SEPARATOR}\n  {title}\n{SEPARATOR}"
 
-def test_list_all_models():
+
+def flush(out):
+    """Write a test's buffered lines in one call."""
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def test_list_all_models(models=None):
     """Test listing all available models."""
-    print_separator("TEST 1: List All Available Models")
+    out = [separator("TEST 1: List All Available Models")]
     
-    models = model_selector.list_all_models(tier=None)
+    if models is None:
+        models = model_selector.list_all_models(tier=None)
     
-    print(f"\nTotal models available: {len(models)}")
+    out.append(f"\nTotal models available: {len(models)}")
     
     for model in models[:5]:  # Show first 5
-        print(f"\n  Model: {model['name']}")
-        print(f"    ID: {model['id']}")
-        print(f"    Provider: {model['provider']}")
-        print(f"    Context: {model['context_window']:,} tokens")
-        print(f"    Capabilities: {', '.join(model['capabilities'])}")
-        print(f"    Tiers: {', '.join(model['tier_availability'])}")
+        out.append(f"\n  Model: {model['name']}")
+        out.append(f"    ID: {model['id']}")
+        out.append(f"    Provider: {model['provider']}")
+        out.append(f"    Context: {model['context_window']:,} tokens")
+        out.append(f"    Capabilities: {model['capabilities_str']}")
+        out.append(f"    Tiers: {model['tier_availability_str']}")
         
         if model.get('pricing'):
             pricing = model['pricing']
-            input_cost = pricing.get('input_per_million', 0)
-            output_cost = pricing.get('output_per_million', 0)
-            if input_cost == 0 and output_cost == 0:
-                print(f"    Cost: FREE")
+            if model['is_free']:
+                out.append(f"    Cost: FREE")
             else:
-                print(f"    Cost: ${input_cost}/M input, ${output_cost}/M output")
+                out.append(f"    Cost: ${pricing['input_per_million']}/M input, ${pricing['output_per_million']}/M output")
     
     if len(models) > 5:
-        print(f"\n  ... and {len(models) - 5} more models")
+        out.append(f"\n  ... and {len(models) - 5} more models")
+    
+    flush(out)
 
 
 def test_group_by_provider():
     """Test grouping models by provider."""
-    print_separator("TEST 2: Group Models by Provider")
+    out = [separator("TEST 2: Group Models by Provider")]
     
-    models = model_selector.list_all_models(tier=None)
-    grouped = model_selector.group_models_by_provider(models)
+    grouped = model_selector.list_all_models_by_provider(tier=None)
     
-    print(f"\nProviders found: {len(grouped)}")
+    out.append(f"\nProviders found: {len(grouped)}")
     
     for provider, provider_models in grouped.items():
-        print(f"\n  {provider.upper()}:")
+        out.append(f"\n  {provider.upper()}:")
         for model in provider_models:
-            free_tag = " [FREE]" if all(c == 0 for c in [
-                model.get('pricing', {}).get('input_per_million', 1),
-                model.get('pricing', {}).get('output_per_million', 1)
-            ]) else ""
+            free_tag = " [FREE]" if model['is_free'] else ""
             recommended = " ⭐" if model.get('recommended') else ""
-            print(f"    - {model['name']}{free_tag}{recommended}")
+            out.append(f"    - {model['name']}{free_tag}{recommended}")
+    
+    flush(out)
 
 
 def test_model_validation():
     """Test model validation."""
-    print_separator("TEST 3: Model Validation")
+    out = [separator("TEST 3: Model Validation")]
     
     test_models = [
         "ollama/llama3.3",
@@ -92,111 +100,130 @@ def test_model_validation():
         "anthropic/claude-haiku-4-5"
     ]
     
-    print("\nValidating models:\n")
+    out.append("\nValidating models:\n")
     
     for model_id in test_models:
         is_valid, error_msg = model_selector.validate_model(model_id)
         
         if is_valid:
             resolved = model_manager.resolve_model_id(model_id)
-            print(f"  ✓ '{model_id}'")
+            out.append(f"  ✓ '{model_id}'")
             if resolved != model_id:
-                print(f"      → Resolves to: {resolved}")
+                out.append(f"      → Resolves to: {resolved}")
         else:
-            print(f"  ✗ '{model_id}'")
-            print(f"      Error: {error_msg}")
+            out.append(f"  ✗ '{model_id}'")
+            out.append(f"      Error: {error_msg}")
+    
+    flush(out)
 
 
 def test_model_info():
     """Test getting detailed model information."""
-    print_separator("TEST 4: Get Model Information")
+    out = [separator("TEST 4: Get Model Information")]
     
     test_model = "ollama/llama3.3"
     
-    print(f"\nGetting info for: {test_model}\n")
+    out.append(f"\nGetting info for: {test_model}\n")
     
     info = model_selector.get_model_info(test_model)
     
     if info:
-        print(f"  Name: {info['name']}")
-        print(f"  ID: {info['id']}")
-        print(f"  Provider: {info['provider']}")
-        print(f"  Context Window: {info['context_window']:,} tokens")
-        print(f"  Max Output: {info.get('max_output_tokens', 'N/A')}")
-        print(f"  Capabilities: {', '.join(info['capabilities'])}")
-        print(f"  Enabled: {info['enabled']}")
-        print(f"  Beta: {info['beta']}")
-        print(f"  Recommended: {info['recommended']}")
-        print(f"  Priority: {info['priority']}")
-        print(f"  Tier Availability: {', '.join(info['tier_availability'])}")
+        out.append(f"  Name: {info['name']}")
+        out.append(f"  ID: {info['id']}")
+        out.append(f"  Provider: {info['provider']}")
+        out.append(f"  Context Window: {info['context_window']:,} tokens")
+        out.append(f"  Max Output: {info.get('max_output_tokens', 'N/A')}")
+        out.append(f"  Capabilities: {info['capabilities_str']}")
+        out.append(f"  Enabled: {info['enabled']}")
+        out.append(f"  Beta: {info['beta']}")
+        out.append(f"  Recommended: {info['recommended']}")
+        out.append(f"  Priority: {info['priority']}")
+        out.append(f"  Tier Availability: {info['tier_availability_str']}")
         
         if info.get('pricing'):
             pricing = info['pricing']
-            print(f"\n  Pricing:")
-            print(f"    Input: ${pricing['input_per_million']}/M tokens")
-            print(f"    Output: ${pricing['output_per_million']}/M tokens")
+            out.append(f"\n  Pricing:")
+            out.append(f"    Input: ${pricing['input_per_million']}/M tokens")
+            out.append(f"    Output: ${pricing['output_per_million']}/M tokens")
     else:
-        print(f"  Model not found!")
+        out.append(f"  Model not found!")
+    
+    flush(out)
 
 
-def test_tier_filtering():
+def test_tier_filtering(all_models=None):
     """Test filtering models by tier."""
-    print_separator("TEST 5: Filter Models by Tier")
+    out = [separator("TEST 5: Filter Models by Tier")]
+    
+    if all_models is None:
+        all_models = model_selector.list_all_models(tier=None)
+    
+    # Split the full listing in one pass instead of re-querying per tier
+    by_tier = {'free': [], 'paid': []}
+    for model in all_models:
+        for tier in model['tier_availability']:
+            if tier in by_tier:
+                by_tier[tier].append(model)
     
-    for tier in ['free', 'paid']:
-        models = model_selector.list_all_models(tier=tier)
-        print(f"\n  {tier.upper()} Tier Models: {len(models)}")
+    for tier, models in by_tier.items():
+        out.append(f"\n  {tier.upper()} Tier Models: {len(models)}")
         
         for model in models[:3]:  # Show first 3
-            print(f"    - {model['name']} ({model['id']})")
+            out.append(f"    - {model['name']} ({model['id']})")
         
         if len(models) > 3:
-            print(f"    ... and {len(models) - 3} more")
+            out.append(f"    ... and {len(models) - 3} more")
+    
+    flush(out)
 
 
-def test_ollama_models():
+def test_ollama_models(all_models=None):
     """Test Ollama-specific models."""
-    print_separator("TEST 6: Ollama Models")
+    out = [separator("TEST 6: Ollama Models")]
+    
+    if all_models is None:
+        all_models = model_selector.list_all_models(tier=None)
     
-    all_models = model_selector.list_all_models(tier=None)
     ollama_models = [m for m in all_models if m['provider'] == 'ollama']
+    env_mode = config.ENV_MODE.value if config and config.ENV_MODE else 'Unknown'
+    api_base = config.OLLAMA_API_BASE if config else 'Not configured'
     
-    print(f"\nOllama models available: {len(ollama_models)}")
+    out.append(f"\nOllama models available: {len(ollama_models)}")
     
     if ollama_models:
-        print(f"Environment Mode: {config.ENV_MODE.value if config else 'Unknown'}")
-        print(f"Ollama API Base: {config.OLLAMA_API_BASE if config else 'Not configured'}")
+        out.append(f"Environment Mode: {env_mode}")
+        out.append(f"Ollama API Base: {api_base}")
         
-        print("\nOllama Models:")
+        out.append("\nOllama Models:")
         for model in ollama_models:
             status = "ENABLED" if model['enabled'] else "DISABLED"
-            print(f"\n  [{status}] {model['name']}")
-            print(f"    ID: {model['id']}")
-            print(f"    Context: {model['context_window']:,} tokens")
-            print(f"    Capabilities: {', '.join(model['capabilities'])}")
-            print(f"    Cost: FREE (runs locally)")
-            print(f"    Tiers: {', '.join(model['tier_availability'])}")
+            out.append(f"\n  [{status}] {model['name']}")
+            out.append(f"    ID: {model['id']}")
+            out.append(f"    Context: {model['context_window']:,} tokens")
+            out.append(f"    Capabilities: {model['capabilities_str']}")
+            out.append(f"    Cost: FREE (runs locally)")
+            out.append(f"    Tiers: {model['tier_availability_str']}")
     else:
-        print("\n  No Ollama models found.")
-        print("  Make sure ENV_MODE=local to enable Ollama models.")
+        out.append("\n  No Ollama models found.")
+        out.append("  Make sure ENV_MODE=local to enable Ollama models.")
+    
+    flush(out)
 
 
 def main():
-    print("\n" + "╔" + "═" * 68 + "╗")
-    print("║" + " " * 20 + "MODEL SELECTION TEST SUITE" + " " * 22 + "║")
-    print("╚" + "═" * 68 + "╝")
+    print(BANNER)
     
     try:
-        test_list_all_models()
+        all_models = model_selector.list_all_models(tier=None)
+        
+        test_list_all_models(all_models)
         test_group_by_provider()
         test_model_validation()
         test_model_info()
-        test_tier_filtering()
-        test_ollama_models()
+        test_tier_filtering(all_models)
+        test_ollama_models(all_models)
         
-        print("\n" + "=" * 70)
-        print("  ✓ All tests completed successfully!")
-        print("=" * 70 + "\n")
+        print(f"\n{SEPARATOR}\n  ✓ All tests completed successfully!\n{SEPARATOR}\n")
         
         return True
         
@@ -10,15 +10,13 @@ This script checks:
 import sys
 import os
 
-# Fix Windows console encoding for checkmarks/unicode
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
-
 # Add parent directory to path to import core modules
 sys.path.insert(0, os.path.dirname(__file__))
 
+from core.utils.console import ensure_utf8_stdio
+# Fix Windows console encoding for checkmarks/unicode
+ensure_utf8_stdio()
+
 from core.ai_models import model_manager
 from core.ai_models.ai_models import ModelProvider
 from core.utils.config import config
@@ -28,16 +26,16 @@ def test_ollama_integration():
     print("Testing Ollama Integration")
     print("=" * 60)
     
+    env_mode = config.ENV_MODE.value if config and config.ENV_MODE else 'Unknown'
+    api_base = config.OLLAMA_API_BASE if config else 'Not configured'
+    
     # Check if running in local mode
-    print(f"\n1. Environment Mode: {config.ENV_MODE.value if config and config.ENV_MODE else 'Unknown'}")
-    print(f"   Ollama API Base: {config.OLLAMA_API_BASE if config else 'Not configured'}")
+    print(f"\n1. Environment Mode: {env_mode}")
+    print(f"   Ollama API Base: {api_base}")
     
     # List all Ollama models in registry
     print("\n2. Ollama Models in Registry:")
-    ollama_models = [
-        m for m in model_manager.registry.get_all(enabled_only=False) 
-        if m.provider == ModelProvider.OLLAMA
-    ]
+    ollama_models = model_manager.registry.get_by_provider(ModelProvider.OLLAMA, enabled_only=False)
     
     if not ollama_models:
         print("   ⚠️  No Ollama models found in registry!")
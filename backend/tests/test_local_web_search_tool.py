@@ -0,0 +1,138 @@
+"""Tests for LocalWebSearchTool's scrape caching, run against a stubbed HTTP session."""
+
+import asyncio
+import os
+
+import pytest
+
+# Configuration refuses to load without these; the values are never used here
+for _name in ("SUPABASE_URL", "SUPABASE_ANON_KEY", "SUPABASE_SERVICE_ROLE_KEY", "SUPABASE_JWT_SECRET"):
+    os.environ.setdefault(_name, "http://localhost" if _name == "SUPABASE_URL" else "test")
+os.environ.setdefault("ENV_MODE", "local")
+
+pytest.importorskip("lxml.html")
+pytest.importorskip("readability")
+
+from core.tools import local_web_search_tool as lwst  # noqa: E402
+
+
+URL = "https://example.com/article"
+PAGE = (
+    b"<html><head><title>Example</title></head><body>"
+    b"<p>Hello from the stubbed page.</p><a href='/next'>Next</a>"
+    b"</body></html>"
+)
+
+
+class _FakeContent:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, body: bytes, charset: str = "utf-8"):
+        self.charset = charset
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.content = _FakeContent(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, body: bytes = PAGE, delay: float = 0, charset: str = "utf-8"):
+        self.body = body
+        self.delay = delay
+        self.charset = charset
+        self.requests = []
+
+    async def get(self, url, **kwargs):
+        self.requests.append(url)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return _FakeResponse(self.body, self.charset)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = _FakeSession()
+    monkeypatch.setattr(lwst, "_get_http_session", lambda timeout: fake)
+    # Parse on the default thread pool; a process pool would pickle the module state
+    monkeypatch.setattr(lwst, "_get_parse_pool", lambda: None)
+    monkeypatch.setattr(lwst, "_scrape_cache", lwst._TTLCache(16, 3600))
+    monkeypatch.setattr(lwst, "_scrape_validators", lwst._TTLCache(16, 3600))
+    monkeypatch.setattr(lwst.LocalWebSearchTool, "_is_safe_public_url", lambda self, url: (True, ""))
+    return fake
+
+
+@pytest.fixture
+def tool():
+    return lwst.LocalWebSearchTool(project_id="test-project", thread_manager=None)
+
+
+@pytest.mark.asyncio
+async def test_second_scrape_is_served_from_cache(session, tool):
+    first = await tool.scrape_webpage(URL)
+    second = await tool.scrape_webpage(URL)
+
+    assert first.success, first.output
+    assert first.data["cache_hit"] is False
+    assert "Hello from the stubbed page." in first.output
+
+    assert second.success
+    assert second.data["cache_hit"] is True
+    assert second.output == first.output
+    assert session.requests == [URL]
+
+
+@pytest.mark.asyncio
+async def test_equivalent_urls_share_a_cache_entry(session, tool):
+    await tool.scrape_webpage(URL)
+    second = await tool.scrape_webpage("HTTPS://EXAMPLE.COM/article?utm_source=feed#top")
+
+    assert second.data["cache_hit"] is True
+    assert session.requests == [URL]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scrapes_share_one_fetch(session, tool):
+    session.delay = 0.05
+
+    results = await asyncio.gather(*(tool.scrape_webpage(URL) for _ in range(3)))
+
+    assert all(result.success for result in results)
+    assert session.requests == [URL]
+
+
+@pytest.mark.asyncio
+async def test_unknown_declared_charset_falls_back_to_sniffing(session, tool):
+    session.charset = "utf8mb4"
+
+    result = await tool.scrape_webpage(URL)
+
+    assert result.success, result.output
+    assert "Hello from the stubbed page." in result.output
+
+
+def test_scrape_cache_evicts_oldest_entries_past_its_weight_bound():
+    cache = lwst._TTLCache(maxsize=16, ttl=3600, max_weight=10, weigh=len)
+
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.set("c", "xxxx")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "xxxx"
+    assert cache.get("c") == "xxxx"
@@ -9,8 +9,14 @@ Run: python verify_setup.py
 """
 
 import os
+import re
 import sys
+import json
+import importlib.util
 import subprocess
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ANSI color codes
@@ -20,27 +26,75 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+OLLAMA_API_BASE = os.environ.get('OLLAMA_API_BASE', 'http://localhost:11434').rstrip('/')
+
+# Checks run concurrently; each buffers its lines here so output stays in order
+_output = threading.local()
+
+def emit(text=""):
+    """Print a line, or buffer it when called from inside run_check."""
+    lines = getattr(_output, 'lines', None)
+    if lines is None:
+        print(text)
+    else:
+        lines.append(text)
+
 def print_header(text):
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"{BLUE}{text:^60}{RESET}")
-    print(f"{BLUE}{'='*60}{RESET}\n")
+    emit(f"\n{BLUE}{'='*60}{RESET}")
+    emit(f"{BLUE}{text:^60}{RESET}")
+    emit(f"{BLUE}{'='*60}{RESET}\n")
 
 def print_success(text):
-    print(f"{GREEN}✅ {text}{RESET}")
+    emit(f"{GREEN}✅ {text}{RESET}")
 
 def print_error(text):
-    print(f"{RED}❌ {text}{RESET}")
+    emit(f"{RED}❌ {text}{RESET}")
 
 def print_warning(text):
-    print(f"{YELLOW}⚠️  {text}{RESET}")
+    emit(f"{YELLOW}⚠️  {text}{RESET}")
 
 def print_info(text):
-    print(f"{BLUE}ℹ️  {text}{RESET}")
+    emit(f"{BLUE}ℹ️  {text}{RESET}")
+
+def run_check(check):
+    """Run a check with its output buffered; returns (passed, lines)."""
+    _output.lines = []
+    try:
+        return check(), _output.lines
+    finally:
+        _output.lines = None
+
+def ollama_api(path):
+    """GET a JSON endpoint from the local Ollama server."""
+    with urllib.request.urlopen(f"{OLLAMA_API_BASE}{path}", timeout=2) as response:
+        return json.loads(response.read())
 
 def check_ollama():
     """Check if Ollama is installed and running."""
     print_header("Checking Ollama")
     
+    # Ask the running server directly; no CLI process to spawn
+    try:
+        version = ollama_api('/api/version').get('version', 'unknown')
+        models = ollama_api('/api/tags').get('models', [])
+    except (OSError, ValueError):
+        # Server not reachable - the CLI can still tell "not installed"
+        # apart from "installed but not running"
+        return check_ollama_cli()
+    
+    print_success(f"Ollama installed: {version}")
+    print_success(f"Ollama service is running at {OLLAMA_API_BASE}")
+    
+    if models:
+        print_info("Available models:")
+        for model in models:
+            emit(f"    {model.get('name', '')}")
+    else:
+        print_warning("No models installed. Install Qwen: ollama pull qwen2.5-coder")
+    return True
+
+def check_ollama_cli():
+    """Check Ollama through its CLI when the HTTP API is unreachable."""
     # Check if ollama command exists
     try:
         result = subprocess.run(['ollama', '--version'], 
@@ -70,7 +124,7 @@ def check_ollama():
                 print_info("Available models:")
                 for line in lines[1:]:  # Skip header
                     if line.strip():
-                        print(f"    {line}")
+                        emit(f"    {line}")
             else:
                 print_warning("No models installed. Install Qwen: ollama pull qwen2.5-coder")
             return True
@@ -81,6 +135,27 @@ def check_ollama():
         print_error(f"Failed to check Ollama models: {e}")
         return False
 
+ENV_KEYS = ('GEMINI_API_KEY', 'TAVILY_API_KEY', 'FIRECRAWL_API_KEY')
+
+def parse_env(lines, keys=None):
+    """Parse KEY=value lines from a .env file into a dict.
+    
+    With keys given, only those are kept and parsing stops once all are found.
+    """
+    env = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        key = key.strip()
+        if keys is not None and key not in keys:
+            continue
+        env[key] = value.strip().strip('"').strip("'")
+        if keys is not None and len(env) == len(keys):
+            break
+    return env
+
 def check_env_file():
     """Check if .env file exists and has necessary keys."""
     print_header("Checking Environment Configuration")
@@ -96,11 +171,12 @@ def check_env_file():
     print_success(f".env file found: {env_path}")
     
     # Read .env and check for important keys
-    with open(env_path, 'r') as f:
-        env_content = f.read()
+    # Stream the file; stop as soon as every key we report on has been seen
+    with open(env_path, 'r', encoding='utf-8', errors='replace') as f:
+        env = parse_env(f, ENV_KEYS)
     
     # Check for GEMINI_API_KEY (optional, for browser tool)
-    if 'GEMINI_API_KEY=' in env_content and not 'GEMINI_API_KEY=""' in env_content:
+    if env.get('GEMINI_API_KEY'):
         print_success("GEMINI_API_KEY configured (browser tool will work)")
     else:
         print_warning("GEMINI_API_KEY not configured")
@@ -108,10 +184,10 @@ def check_env_file():
         print_info("Get free key: https://aistudio.google.com/app/apikey")
     
     # Check for paid API keys (should NOT be needed)
-    if 'TAVILY_API_KEY=' in env_content and not 'TAVILY_API_KEY=""' in env_content:
+    if env.get('TAVILY_API_KEY'):
         print_info("TAVILY_API_KEY found (optional paid search)")
     
-    if 'FIRECRAWL_API_KEY=' in env_content and not 'FIRECRAWL_API_KEY=""' in env_content:
+    if env.get('FIRECRAWL_API_KEY'):
         print_info("FIRECRAWL_API_KEY found (optional paid scraping)")
     
     return True
@@ -128,10 +204,22 @@ def check_backend_files():
         ('backend/core/agentpress/response_processor.py', 'Response processor'),
     ]
     
+    # One directory listing per parent instead of a stat() per file
+    root = Path(__file__).parent
+    listings = {}
+    for file_path, _ in files_to_check:
+        parent = (root / file_path).parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = set()
+    
     all_found = True
     for file_path, description in files_to_check:
-        full_path = Path(__file__).parent / file_path
-        if full_path.exists():
+        full_path = root / file_path
+        if full_path.name in listings[full_path.parent]:
             print_success(f"{description}: {file_path}")
         else:
             print_error(f"{description} NOT FOUND: {file_path}")
@@ -148,27 +236,28 @@ def check_python_packages():
         'aiohttp',
     ]
     
+    # (import name, pip package, purpose)
     optional_packages = [
-        ('duckduckgo_search', 'For free web search'),
-        ('beautifulsoup4', 'For web scraping'),
-        ('playwright', 'For browser automation'),
+        ('duckduckgo_search', 'duckduckgo-search', 'For free web search'),
+        ('bs4', 'beautifulsoup4', 'For web scraping'),
+        ('playwright', 'playwright', 'For browser automation'),
     ]
     
+    # find_spec only locates the module; importing playwright and friends
+    # just to test for them is slow and memory-hungry
     all_found = True
     
     for package in packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print_success(f"Required: {package}")
-        except ImportError:
+        else:
             print_error(f"Required package missing: {package}")
             all_found = False
     
-    for package, purpose in optional_packages:
-        try:
-            __import__(package)
+    for module, package, purpose in optional_packages:
+        if importlib.util.find_spec(module) is not None:
             print_success(f"Optional: {package} ({purpose})")
-        except ImportError:
+        else:
             print_warning(f"Optional package missing: {package} ({purpose})")
             print_info(f"  Install: pip install {package}")
     
@@ -184,8 +273,7 @@ def check_tool_adapter_integration():
         print_error("run.py not found")
         return False
     
-    with open(run_py_path, 'r') as f:
-        content = f.read()
+    content = run_py_path.read_text(encoding='utf-8', errors='replace')
     
     checks = [
         ('if model_provider == "ollama":', 'Ollama detection'),
@@ -194,9 +282,13 @@ def check_tool_adapter_integration():
         ('from core.agentpress.tool_adapter import', 'Tool adapter import'),
     ]
     
+    # Single pass over run.py for all markers
+    pattern = re.compile('|'.join(re.escape(search_str) for search_str, _ in checks))
+    found = set(pattern.findall(content))
+    
     all_found = True
     for search_str, description in checks:
-        if search_str in content:
+        if search_str in found:
             print_success(description)
         else:
             print_error(f"{description} NOT FOUND in run.py")
@@ -244,14 +336,26 @@ def main():
     print_header("🔍 Ollama Tool Calling Verification")
     print_info("This script verifies your setup for using tools with Ollama models\n")
     
-    results = {
-        "Ollama installed and running": check_ollama(),
-        "Environment configuration": check_env_file(),
-        "Required backend files": check_backend_files(),
-        "Python dependencies": check_python_packages(),
-        "Tool adapter integration": check_tool_adapter_integration(),
+    checks = {
+        "Ollama installed and running": check_ollama,
+        "Environment configuration": check_env_file,
+        "Required backend files": check_backend_files,
+        "Python dependencies": check_python_packages,
+        "Tool adapter integration": check_tool_adapter_integration,
     }
     
+    # The checks are independent and mostly wait on subprocesses and disk,
+    # so run them side by side and print their output in the usual order
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {name: executor.submit(run_check, check) for name, check in checks.items()}
+    
+    results = {}
+    for name, future in futures.items():
+        passed, lines = future.result()
+        for line in lines:
+            print(line)
+        results[name] = passed
+    
     print_summary(results)
     
     return 0 if all(results.values()) else 1